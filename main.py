@@ -1,15 +1,79 @@
 import simpy
-import random
-import uuid
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from itertools import repeat
+import numpy as np
 import pandas as pd
-from dataclasses import dataclass
-from typing import List, Dict
-import statistics
+from dataclasses import dataclass, field
+from typing import List
+
+# Process parameters
+
+TYRE_TYPES = ('Resilient-SoftBond', 'Resilient-Basic', 'Press-On')
+TYPE_CODES = ('101', '103', '102')  # Tyre type identifier in the PID
+TYRE_SIZES = ('Small', 'Medium', 'Large')
+TEMPERATURE_RANGES = ('optimal', 'acceptable', 'minimum')
+
+# Station ids, shared by the building steps and the waiting time statistics
+STATIONS = ('wrap_inner_heal', 'apply_bead', 'wrap_heal', 'wrap_bond',
+            'wrap_soft', 'wrap_tread', 'press', 'curing')
+(WRAP_INNER_HEAL, APPLY_BEAD, WRAP_HEAL, WRAP_BOND,
+ WRAP_SOFT, WRAP_TREAD, PRESS, CURING) = range(len(STATIONS))
+
+# Building time ranges in seconds, indexed by station id
+PROCESS_RANGES = (
+    (40, 50),  # wrap_inner_heal
+    (45, 55),  # apply_bead
+    (45, 55),  # wrap_heal
+    (45, 55),  # wrap_bond
+    (45, 55),  # wrap_soft
+    (45, 55),  # wrap_tread
+    (120, 300)  # press, 2-5 minutes in seconds
+)
+
+# Curing time in minutes indexed by (type, size, temperature range):
+# base time per type plus the size and temperature adjustments
+CURE_TABLE = np.array([[[base + size + temp for temp in (0, 20, 40)]
+                        for size in (0, 15, 30)]
+                       for base in (120, 100, 90)], dtype=np.float32)
+# The same table as nested lists of Python floats, for per-tyre scalar lookups
+CURE_TIMES = CURE_TABLE.tolist()
+
+CURING_OVENS = 12
+
+# Building resources used by each tyre type, in flow order, indexed by type id
+BUILD_STEPS = (
+    ('wrap_inner_heal', 'apply_bead', 'wrap_heal',
+     'resilient_bond', 'wrap_soft', 'wrap_tread', 'press'),  # Resilient-SoftBond
+    ('wrap_inner_heal', 'apply_bead', 'wrap_heal',
+     'wrap_tread', 'press'),  # Resilient-Basic
+    ('press_on_bond', 'wrap_soft', 'wrap_tread', 'press')  # Press-On
+)
+
+# All building resources with the station they report as, ordered so that
+# every flow above visits them in sequence
+BUILD_RESOURCES = (
+    ('wrap_inner_heal', WRAP_INNER_HEAL),
+    ('apply_bead', APPLY_BEAD),
+    ('wrap_heal', WRAP_HEAL),
+    ('resilient_bond', WRAP_BOND),
+    ('press_on_bond', WRAP_BOND),
+    ('wrap_soft', WRAP_SOFT),
+    ('wrap_tread', WRAP_TREAD),
+    ('press', PRESS)
+)
+
+# The same flows as arrays for the batch schedulers: whether each tyre type
+# uses each building resource, and the station id each resource reports as
+ROUTES = np.array([[resource in steps for resource, _ in BUILD_RESOURCES]
+                   for steps in BUILD_STEPS])
+RESOURCE_STATIONS = np.array([station for _, station in BUILD_RESOURCES])
 
 # Data structures
 
 
-@dataclass
+@dataclass(slots=True)
 class TyreOrder:
     pid: str
     tyre_type: str
@@ -17,20 +81,57 @@ class TyreOrder:
     tread_pattern: str
     size: str
     quantity: int
+    type_idx: int = field(init=False)
+    size_idx: int = field(init=False)
 
+    def __post_init__(self):
+        self.type_idx = TYRE_TYPES.index(self.tyre_type)
+        self.size_idx = TYRE_SIZES.index(self.size)
 
-@dataclass
+
+# Order CSV columns and their dtypes, in TyreOrder field order
+ORDER_DTYPES = {
+    'PID': 'string',
+    'TyreType': 'category',
+    'Brand': 'string',
+    'TreadPattern': 'string',
+    'Size': 'category',
+    'Quantity': 'int32'
+}
+
+
+@dataclass(slots=True)
 class ProductionStats:
-    serial_number: str
-    pid: str
-    start_time: float
-    end_time: float = 0
-    waiting_times: Dict[str, float] = None
-    total_production_time: float = 0
+    """Production records stored column-wise, one row per produced tyre.
+
+    Times are float32 minutes, ample precision for a shift of a few hundred minutes.
+    """
+    serial_number: np.ndarray
+    pid: np.ndarray
+    type_idx: np.ndarray
+    start_time: np.ndarray
+    end_time: np.ndarray
+    # Waiting time per tyre and station id, NaN where a tyre skips the station
+    waiting_times: np.ndarray
+
+    def __len__(self):
+        return len(self.end_time)
+
+    @property
+    def total_production_time(self) -> np.ndarray:
+        return self.end_time - self.start_time
+
+
+def draw_service_times(rng: np.random.Generator, n_tyres: int) -> np.ndarray:
+    """Draw building times in minutes for every tyre at every building station"""
+    lows, highs = np.array(PROCESS_RANGES).T
+    service = rng.uniform(lows, highs, size=(n_tyres, len(PROCESS_RANGES)))
+    # Convert to minutes
+    return (service / 60).astype(np.float32)
 
 
 class TyreFactory:
-    def __init__(self, env):
+    def __init__(self, env, n_tyres: int, rng: np.random.Generator):
         self.env = env
         # Resources
         self.wrap_inner_heal = simpy.Resource(env, capacity=1)
@@ -41,221 +142,334 @@ class TyreFactory:
         self.wrap_soft = simpy.Resource(env, capacity=1)
         self.wrap_tread = simpy.Resource(env, capacity=1)
         self.press = simpy.Resource(env, capacity=1)
-        self.curing_ovens = simpy.Resource(env, capacity=12)
-
-        # Statistics
-        self.production_stats: List[ProductionStats] = []
-
-    def get_process_time(self, process_name: str) -> float:
-        """Return processing time for each station"""
-        time_ranges = {
-            'wrap_inner_heal': (40, 50),
-            'apply_bead': (45, 55),
-            'wrap_heal': (45, 55),
-            'wrap_bond': (45, 55),
-            'wrap_soft': (45, 55),
-            'wrap_tread': (45, 55),
-            'press': (120, 300)  # 2-5 minutes in seconds
-        }
-        # Convert to minutes
-        return random.uniform(*time_ranges.get(process_name, (45, 55))) / 60
-
-    def get_curing_time(self, tyre_type: str, size: str, temp_range: str) -> float:
-        """Calculate curing time based on type, size and temperature range"""
-        base_times = {
-            'Resilient-SoftBond': 120,
-            'Resilient-Basic': 100,
-            'Press-On': 90
-        }
+        self.curing_ovens = simpy.Resource(env, capacity=CURING_OVENS)
 
-        temp_adjustments = {
-            'optimal': 0,
-            'acceptable': 20,
-            'minimum': 40
-        }
+        # Process flow per tyre type as (resource, station id) pairs
+        stations = dict(BUILD_RESOURCES)
+        self.build_steps = tuple(
+            tuple((getattr(self, resource), stations[resource]) for resource in steps)
+            for steps in BUILD_STEPS
+        )
 
-        size_adjustments = {
-            'Small': 0,
-            'Medium': 15,
-            'Large': 30
-        }
+        # Statistics, one row per tyre; end stays NaN until the tyre is cured
+        self.serial_numbers = np.zeros(n_tyres, dtype=np.int64)
+        self._next_serial_number = 0
+        self.pids = np.empty(n_tyres, dtype=object)
+        self.type_idx = np.empty(n_tyres, dtype=np.int8)
+        self.start = np.full(n_tyres, np.nan, dtype=np.float32)
+        self.end = np.full(n_tyres, np.nan, dtype=np.float32)
+        self.waits = np.full((n_tyres, len(STATIONS)), np.nan, dtype=np.float32)
 
-        base_time = base_times[tyre_type]
-        temp_adj = temp_adjustments[temp_range]
-        size_adj = size_adjustments[size]
+        # Processing times and curing temperature ranges, drawn up front for all tyres
+        self.service_times = draw_service_times(rng, n_tyres)
+        self.temp_idx = rng.integers(len(TEMPERATURE_RANGES), size=n_tyres, dtype=np.int8)
 
-        return base_time + temp_adj + size_adj
+    def get_curing_time(self, type_idx: int, size_idx: int, temp_idx: int) -> float:
+        """Calculate curing time based on type, size and temperature range"""
+        return CURE_TIMES[type_idx][size_idx][temp_idx]
 
-    def process_tyre(self, order: TyreOrder):
+    def process_tyre(self, order: TyreOrder, i: int):
         """Process a single tyre through the production line"""
-        serial_number = str(uuid.uuid4())
-        start_time = self.env.now
-        waiting_times = {}
-
-        # Create stats object
-        stats = ProductionStats(
-            serial_number=serial_number,
-            pid=order.pid,
-            start_time=start_time,
-            waiting_times={}
-        )
+        env = self.env
+        timeout = env.timeout
+        self._next_serial_number += 1
+        self.serial_numbers[i] = self._next_serial_number
+        self.pids[i] = order.pid
+        self.type_idx[i] = order.type_idx
+        self.start[i] = env.now
+        # Row view, so each step is a plain 1-D store by station id
+        waits = self.waits[i]
+        service_times = self.service_times[i].tolist()
+
+        # Execute building process for this tyre type's flow
+        for resource, station in self.build_steps[order.type_idx]:
+            arrival_time = env.now
+            with resource.request() as req:
+                yield req
+                waits[station] = env.now - arrival_time
+                yield timeout(service_times[station])
 
-        # Different process flows based on tyre type
-        if order.tyre_type == 'Resilient-SoftBond':
-            # Full process for Resilient tyres with soft & bond
-            steps = [
-                (self.wrap_inner_heal, 'wrap_inner_heal'),
-                (self.apply_bead, 'apply_bead'),
-                (self.wrap_heal, 'wrap_heal'),
-                (self.resilient_bond, 'wrap_bond'),
-                (self.wrap_soft, 'wrap_soft'),
-                (self.wrap_tread, 'wrap_tread'),
-                (self.press, 'press')
-            ]
-        elif order.tyre_type == 'Resilient-Basic':
-            # Process for Resilient tyres without soft & bond
-            steps = [
-                (self.wrap_inner_heal, 'wrap_inner_heal'),
-                (self.apply_bead, 'apply_bead'),
-                (self.wrap_heal, 'wrap_heal'),
-                (self.wrap_tread, 'wrap_tread'),
-                (self.press, 'press')
-            ]
-        else:  # Press-On
-            # Process for Press-On tyres
-            steps = [
-                (self.press_on_bond, 'wrap_bond'),
-                (self.wrap_soft, 'wrap_soft'),
-                (self.wrap_tread, 'wrap_tread'),
-                (self.press, 'press')
-            ]
-
-        # Execute building process
-        for resource, step_name in steps:
-            arrival_time = self.env.now
-            req = resource.request()
+        # Curing process
+        arrival_time = env.now
+        with self.curing_ovens.request() as req:
             yield req
-            waiting_time = self.env.now - arrival_time
-            stats.waiting_times[step_name] = waiting_time
-            process_time = self.get_process_time(step_name)
-            yield self.env.timeout(process_time)
-            resource.release(req)
+            waits[CURING] = env.now - arrival_time
 
-        # Curing process
-        arrival_time = self.env.now
-        req = self.curing_ovens.request()
-        yield req
-        waiting_time = self.env.now - arrival_time
-        stats.waiting_times['curing'] = waiting_time
-
-        # Simulate random temperature range
-        temp_range = random.choice(['optimal', 'acceptable', 'minimum'])
-        curing_time = self.get_curing_time(
-            order.tyre_type, order.size, temp_range)
-        yield self.env.timeout(curing_time)
-        self.curing_ovens.release(req)
+            # Random temperature range, drawn with the other inputs
+            curing_time = self.get_curing_time(
+                order.type_idx, order.size_idx, self.temp_idx[i])
+            yield timeout(curing_time)
 
         # Record completion
-        stats.end_time = self.env.now
-        stats.total_production_time = stats.end_time - stats.start_time
-        self.production_stats.append(stats)
+        self.end[i] = env.now
+
+    @property
+    def production_stats(self) -> ProductionStats:
+        """Statistics of the tyres completed so far, in completion order"""
+        done = np.flatnonzero(~np.isnan(self.end))
+        done = done[np.argsort(self.end[done], kind='stable')]
+        return ProductionStats(
+            serial_number=self.serial_numbers[done],
+            pid=self.pids[done],
+            type_idx=self.type_idx[done],
+            start_time=self.start[done],
+            end_time=self.end[done],
+            waiting_times=self.waits[done]
+        )
 
     def get_production_insights(self):
         """Generate detailed insights from production statistics"""
-        if not self.production_stats:
-            return "No production data available"
-
-        total_tyres = len(self.production_stats)
-
-        # Calculate overall statistics
-        all_production_times = [
-            stat.total_production_time for stat in self.production_stats]
-        avg_production_time = statistics.mean(all_production_times)
-        max_production_time = max(all_production_times)
-        min_production_time = min(all_production_times)
-
-        # Calculate statistics by tyre type
-        type_stats = {}
-        for stat in self.production_stats:
-            tyre_type = stat.pid.split('.')[0]
-            if tyre_type not in type_stats:
-                type_stats[tyre_type] = []
-            type_stats[tyre_type].append(stat.total_production_time)
-
-        type_averages = {
-            tyre_type: {
-                'count': len(times),
-                'avg_time': statistics.mean(times),
-                'min_time': min(times),
-                'max_time': max(times)
-            }
-            for tyre_type, times in type_stats.items()
-        }
-
-        # Calculate waiting times for each station
-        station_waiting_times = {}
-        for stat in self.production_stats:
-            for station, time in stat.waiting_times.items():
-                if station not in station_waiting_times:
-                    station_waiting_times[station] = []
-                station_waiting_times[station].append(time)
-
-        station_stats = {
-            station: {
-                'avg_wait': statistics.mean(times),
-                'max_wait': max(times),
-                'min_wait': min(times),
-                'total_wait': sum(times)
-            }
-            for station, times in station_waiting_times.items()
+        return summarize_production(self.production_stats, self.env.now)
+
+
+def summarize_production(production_stats: ProductionStats, simulation_time: float):
+    """Generate detailed insights from production statistics"""
+    if not production_stats:
+        return "No production data available"
+
+    total_tyres = len(production_stats)
+
+    # Calculate overall statistics
+    times = production_stats.total_production_time
+    avg_production_time = float(times.mean(dtype=np.float64))
+    max_production_time = float(times.max())
+    min_production_time = float(times.min())
+
+    # Calculate statistics by tyre type, reducing each type's rows as one group
+    type_idx = production_stats.type_idx
+    counts = np.bincount(type_idx, minlength=len(TYRE_TYPES))
+    sums = np.bincount(type_idx, weights=times, minlength=len(TYRE_TYPES))
+    present = np.flatnonzero(counts)
+    grouped = times[np.argsort(type_idx, kind='stable')]
+    group_starts = (np.cumsum(counts) - counts)[present]
+
+    type_averages = {
+        TYPE_CODES[tyre_type]: {
+            'count': count,
+            'avg_time': total / count,
+            'min_time': min_time,
+            'max_time': max_time
         }
-
-        return {
-            'overall_statistics': {
-                'total_tyres_produced': total_tyres,
-                'avg_production_time': avg_production_time,
-                'max_production_time': max_production_time,
-                'min_production_time': min_production_time,
-                'total_simulation_time': self.env.now
-            },
-            'tyre_type_statistics': type_averages,
-            'station_statistics': station_stats
+        for tyre_type, count, total, min_time, max_time in zip(
+            present.tolist(), counts[present].tolist(), sums[present].tolist(),
+            np.minimum.reduceat(grouped, group_starts).tolist(),
+            np.maximum.reduceat(grouped, group_starts).tolist())
+    }
+
+    # Calculate waiting times for each station visited by any tyre
+    waits = production_stats.waiting_times
+    visited = np.flatnonzero((~np.isnan(waits)).any(axis=0))
+    waits = waits[:, visited]
+    station_stats = {
+        STATIONS[station]: {
+            'avg_wait': avg_wait,
+            'max_wait': max_wait,
+            'min_wait': min_wait,
+            'total_wait': total_wait
         }
+        for station, avg_wait, max_wait, min_wait, total_wait in zip(
+            visited.tolist(), np.nanmean(waits, axis=0, dtype=np.float64).tolist(),
+            np.nanmax(waits, axis=0).tolist(), np.nanmin(waits, axis=0).tolist(),
+            np.nansum(waits, axis=0, dtype=np.float64).tolist())
+    }
+
+    return {
+        'overall_statistics': {
+            'total_tyres_produced': total_tyres,
+            'avg_production_time': avg_production_time,
+            'max_production_time': max_production_time,
+            'min_production_time': min_production_time,
+            'total_simulation_time': simulation_time
+        },
+        'tyre_type_statistics': type_averages,
+        'station_statistics': station_stats
+    }
+
+# Batch solver
+
+
+def _serve_fifo(arrivals: np.ndarray, service: np.ndarray):
+    """Return (start, end) times at a single FIFO server for arrival-sorted tyres"""
+    # end[k] = max(arrival[k], end[k-1]) + service[k], unrolled into a running max
+    elapsed = np.cumsum(service, dtype=np.float64)
+    end = elapsed + np.maximum.accumulate(arrivals - elapsed + service)
+    return end - service, end
+
+
+def _schedule_vectorised(type_idx: np.ndarray, service_times: np.ndarray,
+                         curing_times: np.ndarray):
+    """Return (waits, end_time) per tyre, resolving each building station with NumPy"""
+    n = len(type_idx)
+    ready = np.zeros(n)
+    waits = np.full((n, len(STATIONS)), np.nan, dtype=np.float32)
+    for resource, station in enumerate(RESOURCE_STATIONS):
+        users = np.flatnonzero(ROUTES[type_idx, resource])
+        users = users[np.argsort(ready[users], kind='stable')]
+        arrivals = ready[users]
+        start, ready[users] = _serve_fifo(arrivals, service_times[users, station])
+        waits[users, station] = start - arrivals
+
+    # Curing: tyres take the oven that frees up first, in order of arrival
+    curing_times = curing_times.tolist()
+    arrivals = ready.tolist()
+    end_time = np.empty(n)
+    oven_free = [0.0] * CURING_OVENS
+    for i in np.argsort(ready, kind='stable').tolist():
+        start = max(arrivals[i], oven_free[0])
+        waits[i, CURING] = start - arrivals[i]
+        end_time[i] = start + curing_times[i]
+        heapq.heapreplace(oven_free, end_time[i])
+    return waits, end_time
+
+
+def _schedule_loops(type_idx: np.ndarray, service_times: np.ndarray,
+                    curing_times: np.ndarray):
+    """Return (waits, end_time) per tyre, stepping each queue tyre by tyre"""
+    n = len(type_idx)
+    ready = np.zeros(n)
+    waits = np.full((n, len(STATIONS)), np.nan, dtype=np.float32)
+    for resource in range(len(RESOURCE_STATIONS)):
+        station = RESOURCE_STATIONS[resource]
+        users = np.flatnonzero(ROUTES[type_idx, resource])
+        station_free = 0.0
+        for i in users[np.argsort(ready[users], kind='mergesort')]:
+            start = max(ready[i], station_free)
+            waits[i, station] = start - ready[i]
+            station_free = start + service_times[i, station]
+            ready[i] = station_free
+
+    # Curing: tyres take the oven that frees up first, in order of arrival
+    oven_free = np.zeros(CURING_OVENS)
+    end_time = np.empty(n)
+    for i in np.argsort(ready, kind='mergesort'):
+        # Linear min scan; with a dozen ovens this beats keeping them ordered
+        oven = 0
+        for j in range(1, CURING_OVENS):
+            if oven_free[j] < oven_free[oven]:
+                oven = j
+        start = max(ready[i], oven_free[oven])
+        waits[i, CURING] = start - ready[i]
+        end_time[i] = start + curing_times[i]
+        oven_free[oven] = end_time[i]
+    return waits, end_time
+
+
+# Importing numba and loading the cached kernel costs about 0.4 s per process,
+# which the compiled scheduler only earns back on very large batches
+SCHEDULE_JIT_MIN_TYRES = 500_000
+
+
+@cache
+def _compiled_schedule():
+    """Return _schedule_loops compiled with numba, or None when it is not installed"""
+    try:
+        from numba import njit
+    except ImportError:  # Optional: without numba the vectorised NumPy scheduler is used
+        return None
+    return njit(cache=True)(_schedule_loops)
+
+
+def schedule(type_idx: np.ndarray, service_times: np.ndarray, curing_times: np.ndarray):
+    """Return (waits, end_time) per tyre, compiled with numba for very large batches"""
+    if len(type_idx) >= SCHEDULE_JIT_MIN_TYRES:
+        compiled = _compiled_schedule()
+        if compiled is not None:
+            return compiled(type_idx, service_times, curing_times)
+    return _schedule_vectorised(type_idx, service_times, curing_times)
+
+
+def solve_production(orders: List[TyreOrder], simulation_time: float,
+                     rng: np.random.Generator) -> ProductionStats:
+    """Solve the production line analytically instead of stepping SimPy processes.
+
+    Every building station is a single FIFO server and no flow ever revisits a
+    station, so the stations can be resolved one after another in flow order.
+    The curing ovens form one FIFO queue in front of CURING_OVENS servers.
+    """
+    quantities = [order.quantity for order in orders]
+    # Integer dtype explicitly, so an empty order list still gives index arrays
+    type_idx = np.repeat(np.array([order.type_idx for order in orders], dtype=np.intp),
+                         quantities)
+    size_idx = np.repeat(np.array([order.size_idx for order in orders], dtype=np.intp),
+                         quantities)
+    n = len(type_idx)
+
+    # All tyres are released at t=0, in order sequence
+    service_times = draw_service_times(rng, n)
+    temp_idx = rng.integers(len(TEMPERATURE_RANGES), size=n, dtype=np.int8)
+    curing_times = CURE_TABLE[type_idx, size_idx, temp_idx]
+    waits, end_time = schedule(type_idx, service_times, curing_times)
+
+    # Tyres still curing at the end of the shift are not counted as produced
+    done = np.flatnonzero(end_time < simulation_time)
+    done = done[np.argsort(end_time[done], kind='stable')]
+    pids = np.repeat([order.pid for order in orders], quantities)
+    return ProductionStats(
+        serial_number=done + 1,  # Tyres start in order sequence
+        pid=pids[done],
+        type_idx=type_idx[done],
+        start_time=np.zeros(len(done), dtype=np.float32),
+        end_time=end_time[done].astype(np.float32),
+        waiting_times=waits[done]
+    )
 
 # Simulation setup and execution
 
 
-def run_simulation(orders: List[TyreOrder], simulation_time: int = 480):  # 8-hour shift
+def run_simulation(orders: List[TyreOrder], simulation_time: int = 480,  # 8-hour shift
+                   engine: str = 'batch', seed=None):
+    """Run the shift with the batch solver, or step it with SimPy when engine='simpy'
+
+    Runs with the same seed draw the same inputs and give the same results.
+    """
+    rng = np.random.default_rng(seed)
+    if engine == 'batch':
+        production_stats = solve_production(orders, simulation_time, rng)
+        return summarize_production(production_stats, simulation_time)
+    if engine != 'simpy':
+        raise ValueError(f"Unknown simulation engine: {engine}")
+
     env = simpy.Environment()
-    factory = TyreFactory(env)
+    tyre_orders = [order for order in orders for _ in range(order.quantity)]
+    factory = TyreFactory(env, len(tyre_orders), rng)
 
-    # Create processes for each order
-    for order in orders:
-        for _ in range(order.quantity):
-            env.process(factory.process_tyre(order))
+    # Create processes for each tyre
+    for i, order in enumerate(tyre_orders):
+        env.process(factory.process_tyre(order, i))
 
     # Run simulation
     env.run(until=simulation_time)
 
     return factory.get_production_insights()
 
+
+def run_scenarios(scenarios: List[List[TyreOrder]], simulation_time: int = 480,
+                  engine: str = 'batch', seed=None, max_workers=None):
+    """Run one shift per order mix across worker processes, in scenario order
+
+    Each scenario gets its own seed spawned from seed, so the results do not
+    depend on which worker runs it.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(scenarios))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_simulation, scenarios, repeat(simulation_time),
+                                 repeat(engine), seeds))
+
 # Helper function to create dataframe for visualization
 
 
-def create_production_dataframe(production_stats):
-    data = []
-    for stat in production_stats:
-        row = {
-            'serial_number': stat.serial_number,
-            'pid': stat.pid,
-            'start_time': stat.start_time,
-            'end_time': stat.end_time,
-            'total_time': stat.total_production_time
-        }
-        # Add waiting times for each station
-        for station, time in stat.waiting_times.items():
-            row[f'{station}_wait'] = time
-        data.append(row)
+def create_production_dataframe(production_stats: ProductionStats):
+    data = {
+        'serial_number': production_stats.serial_number,
+        'pid': production_stats.pid,
+        'start_time': production_stats.start_time,
+        'end_time': production_stats.end_time,
+        'total_time': production_stats.total_production_time
+    }
+    # Add waiting times for each station visited by any tyre
+    waits = production_stats.waiting_times
+    for station in np.flatnonzero((~np.isnan(waits)).any(axis=0)):
+        data[f'{STATIONS[station]}_wait'] = waits[:, station]
     return pd.DataFrame(data)
 
 
@@ -264,16 +478,10 @@ if __name__ == "__main__":
     try:
         # Read orders from CSV
         print("Loading orders from orders.csv...")
-        orders_df = pd.read_csv('orders.csv')
+        orders_df = pd.read_csv('orders.csv', dtype=ORDER_DTYPES, engine='c')
         orders = [
-            TyreOrder(
-                pid=row['PID'],
-                tyre_type=row['TyreType'],
-                brand=row['Brand'],
-                tread_pattern=row['TreadPattern'],
-                size=row['Size'],
-                quantity=int(row['Quantity'])  # Ensure quantity is integer
-            ) for _, row in orders_df.iterrows()
+            TyreOrder(*row) for row in orders_df[list(ORDER_DTYPES)].itertuples(
+                index=False, name=None)
         ]
 
         print(f"\nLoaded {len(orders)} unique orders")
@@ -299,8 +507,7 @@ if __name__ == "__main__":
               overall['total_simulation_time']:.2f} minutes")
 
         print(f"\nPRODUCTION BY TYRE TYPE:")
-        type_mapping = {'101': 'Resilient-SoftBond',
-                        '102': 'Press-On', '103': 'Resilient-Basic'}
+        type_mapping = dict(zip(TYPE_CODES, TYRE_TYPES))
         for type_id, stats in insights['tyre_type_statistics'].items():
             tyre_type = type_mapping.get(type_id, type_id)
             print(f"\n{tyre_type}:")
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from main import (CURE_TABLE, TEMPERATURE_RANGES, TyreOrder, _compiled_schedule,
+                  _schedule_loops, _schedule_vectorised, draw_service_times,
+                  run_simulation)
+
+ORDERS = [
+    TyreOrder('101.201.301.401', 'Resilient-SoftBond', 'BrandA', 'Pattern1', 'Small', 40),
+    TyreOrder('103.202.302.402', 'Resilient-Basic', 'BrandB', 'Pattern2', 'Medium', 45),
+    TyreOrder('102.203.303.403', 'Press-On', 'BrandC', 'Pattern3', 'Large', 35)
+]
+
+
+class EngineAgreementTest(unittest.TestCase):
+    """The schedulers and engines must give the same results for the same draws"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        quantities = [order.quantity for order in ORDERS]
+        self.type_idx = np.repeat(
+            np.array([order.type_idx for order in ORDERS], dtype=np.intp), quantities)
+        size_idx = np.repeat(
+            np.array([order.size_idx for order in ORDERS], dtype=np.intp), quantities)
+        n = len(self.type_idx)
+        self.service_times = draw_service_times(rng, n)
+        temp_idx = rng.integers(len(TEMPERATURE_RANGES), size=n, dtype=np.int8)
+        self.curing_times = CURE_TABLE[self.type_idx, size_idx, temp_idx]
+
+    def assert_same_schedule(self, scheduler):
+        expected = _schedule_vectorised(self.type_idx, self.service_times, self.curing_times)
+        actual = scheduler(self.type_idx, self.service_times, self.curing_times)
+        for expected_array, actual_array in zip(expected, actual):
+            np.testing.assert_array_equal(actual_array, expected_array)
+
+    def test_loop_scheduler_matches_vectorised(self):
+        self.assert_same_schedule(_schedule_loops)
+
+    def test_compiled_scheduler_matches_vectorised(self):
+        compiled = _compiled_schedule()
+        if compiled is None:
+            self.skipTest("numba is not installed")
+        self.assert_same_schedule(compiled)
+
+    def test_batch_engine_matches_simpy(self):
+        self.assertEqual(run_simulation(ORDERS, engine='batch', seed=1),
+                         run_simulation(ORDERS, engine='simpy', seed=1))
+
+    def test_no_orders(self):
+        for engine in ('batch', 'simpy'):
+            self.assertEqual(run_simulation([], engine=engine),
+                             "No production data available")
+
+
+if __name__ == '__main__':
+    unittest.main()